@@ -11,6 +11,8 @@ load_dotenv()
 # Import Base dan Models
 from core.database import Base
 from models.ticket import Ticket
+from models.shadow_result import ShadowResult
+from models.zstd_dictionary import ZstdDictionary
 
 # Alembic Config object
 config = context.config
@@ -0,0 +1,51 @@
+"""add tickets_archive table
+
+Revision ID: 3f1b9c2d8e4a
+Revises: 7cd2adfa37c5
+Create Date: 2026-10-19 10:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1b9c2d8e4a'
+down_revision: Union[str, Sequence[str], None] = '7cd2adfa37c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Enum types already exist from the initial migration
+    op.create_table('tickets_archive',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('category', postgresql.ENUM('billing', 'technical', 'feature', 'general', name='category', create_type=False), nullable=True),
+    sa.Column('sentiment_score', sa.Integer(), nullable=True),
+    sa.Column('urgency', postgresql.ENUM('high', 'medium', 'low', name='urgency', create_type=False), nullable=True),
+    sa.Column('ai_draft', sa.Text(), nullable=True),
+    sa.Column('status', postgresql.ENUM('pending', 'processed', 'resolved', 'error', name='ticketstatus', create_type=False), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('resolved_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_tickets_archive_email'), 'tickets_archive', ['email'], unique=False)
+    op.create_index(op.f('ix_tickets_archive_archived_at'), 'tickets_archive', ['archived_at'], unique=False)
+    # Lets the archiver find resolved tickets by age without scanning the working set
+    op.create_index('idx_status_resolved', 'tickets', ['status', 'resolved_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_status_resolved', table_name='tickets')
+    op.drop_index(op.f('ix_tickets_archive_archived_at'), table_name='tickets_archive')
+    op.drop_index(op.f('ix_tickets_archive_email'), table_name='tickets_archive')
+    op.drop_table('tickets_archive')
@@ -0,0 +1,49 @@
+"""store ticket text as bytea for optional compression
+
+Revision ID: 9a4e6d0c1b27
+Revises: 3f1b9c2d8e4a
+Create Date: 2026-10-19 14:03:18.551902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4e6d0c1b27'
+down_revision: Union[str, Sequence[str], None] = '3f1b9c2d8e4a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TEXT_COLUMNS = [
+    ('tickets', 'message'),
+    ('tickets', 'ai_draft'),
+    ('tickets_archive', 'message'),
+    ('tickets_archive', 'ai_draft'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows become uncompressed values (0x00 tag + UTF-8), which
+    # core.compression reads as-is. Run utils/recompress.py to compress them.
+    for table, column in TEXT_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.LargeBinary(),
+            postgresql_using=f"'\\x00'::bytea || convert_to({column}, 'UTF8')",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Only valid for uncompressed rows: run
+    # `TEXT_COMPRESSION=off python -m utils.recompress` first.
+    for table, column in TEXT_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.Text(),
+            postgresql_using=f"convert_from(substring({column} from 2), 'UTF8')",
+        )
@@ -0,0 +1,28 @@
+"""add ticket draft_edited_at
+
+Revision ID: a6d2e4f8c913
+Revises: f3a7c1e95b62
+Create Date: 2026-10-20 09:14:27.640318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d2e4f8c913'
+down_revision: Union[str, Sequence[str], None] = 'f3a7c1e95b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tickets', sa.Column('draft_edited_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tickets', 'draft_edited_at')
@@ -0,0 +1,28 @@
+"""add ticket request fingerprint
+
+Revision ID: b19c5e7d2f40
+Revises: a6d2e4f8c913
+Create Date: 2026-10-20 10:02:51.774093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b19c5e7d2f40'
+down_revision: Union[str, Sequence[str], None] = 'a6d2e4f8c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tickets', sa.Column('request_fingerprint', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tickets', 'request_fingerprint')
@@ -0,0 +1,30 @@
+"""add ticket idempotency key
+
+Revision ID: c52d7f3a9e10
+Revises: 9a4e6d0c1b27
+Create Date: 2026-10-19 16:41:07.318264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c52d7f3a9e10'
+down_revision: Union[str, Sequence[str], None] = '9a4e6d0c1b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tickets', sa.Column('idempotency_key', sa.String(length=64), nullable=True))
+    op.create_unique_constraint(op.f('tickets_idempotency_key_key'), 'tickets', ['idempotency_key'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(op.f('tickets_idempotency_key_key'), 'tickets', type_='unique')
+    op.drop_column('tickets', 'idempotency_key')
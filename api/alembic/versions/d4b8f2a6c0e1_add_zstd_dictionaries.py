@@ -0,0 +1,34 @@
+"""add zstd_dictionaries table
+
+Revision ID: d4b8f2a6c0e1
+Revises: b19c5e7d2f40
+Create Date: 2026-10-20 14:37:12.508316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b8f2a6c0e1'
+down_revision: Union[str, Sequence[str], None] = 'b19c5e7d2f40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('zstd_dictionaries',
+    sa.Column('dict_id', sa.BigInteger(), autoincrement=False, nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('is_current', sa.Boolean(), server_default=sa.false(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('dict_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('zstd_dictionaries')
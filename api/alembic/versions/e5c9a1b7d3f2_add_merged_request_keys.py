@@ -0,0 +1,37 @@
+"""add merged_request_keys table
+
+Revision ID: e5c9a1b7d3f2
+Revises: d4b8f2a6c0e1
+Create Date: 2026-10-20 16:12:45.301927
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c9a1b7d3f2'
+down_revision: Union[str, Sequence[str], None] = 'd4b8f2a6c0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('merged_request_keys',
+    sa.Column('idempotency_key', sa.String(length=64), nullable=False),
+    sa.Column('request_fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('ticket_id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['ticket_id'], ['tickets.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('idempotency_key')
+    )
+    op.create_index(op.f('ix_merged_request_keys_ticket_id'), 'merged_request_keys', ['ticket_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_merged_request_keys_ticket_id'), table_name='merged_request_keys')
+    op.drop_table('merged_request_keys')
@@ -0,0 +1,28 @@
+"""add ticket version for optimistic locking
+
+Revision ID: e81f0b6c4d53
+Revises: c52d7f3a9e10
+Create Date: 2026-10-19 18:22:54.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e81f0b6c4d53'
+down_revision: Union[str, Sequence[str], None] = 'c52d7f3a9e10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tickets', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tickets', 'version')
@@ -0,0 +1,48 @@
+"""add triage_shadow_results table
+
+Revision ID: f3a7c1e95b62
+Revises: e81f0b6c4d53
+Create Date: 2026-10-19 20:05:33.127640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a7c1e95b62'
+down_revision: Union[str, Sequence[str], None] = 'e81f0b6c4d53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('triage_shadow_results',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('ticket_id', sa.Uuid(), nullable=False),
+    sa.Column('candidate', sa.String(length=255), nullable=False),
+    sa.Column('production_category', sa.String(length=32), nullable=False),
+    sa.Column('production_urgency', sa.String(length=32), nullable=False),
+    sa.Column('production_sentiment_score', sa.Integer(), nullable=False),
+    sa.Column('production_latency_ms', sa.Float(), nullable=False),
+    sa.Column('category', sa.String(length=32), nullable=True),
+    sa.Column('urgency', sa.String(length=32), nullable=True),
+    sa.Column('sentiment_score', sa.Integer(), nullable=True),
+    sa.Column('draft_reply', sa.Text(), nullable=True),
+    sa.Column('latency_ms', sa.Float(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_shadow_candidate_created', 'triage_shadow_results', ['candidate', 'created_at'], unique=False)
+    op.create_index(op.f('ix_triage_shadow_results_ticket_id'), 'triage_shadow_results', ['ticket_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_triage_shadow_results_ticket_id'), table_name='triage_shadow_results')
+    op.drop_index('idx_shadow_candidate_created', table_name='triage_shadow_results')
+    op.drop_table('triage_shadow_results')
@@ -0,0 +1,21 @@
+from fastapi import APIRouter
+
+from core.cpu_pool import CPU_POOL_MODE, CPU_POOL_WORKERS
+from core.loop_monitor import loop_monitor
+from core.startup import startup_report
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("/event-loop")
+async def get_event_loop_metrics():
+    return {
+        "cpu_pool_mode": CPU_POOL_MODE,
+        "cpu_pool_workers": CPU_POOL_WORKERS,
+        **loop_monitor.snapshot(),
+    }
+
+
+@router.get("/startup")
+async def get_startup_metrics():
+    return startup_report
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+from typing import List
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select, func, case
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database import get_db
+from models.shadow_result import ShadowResult
+from schemas.shadow import ShadowCandidateReport
+
+router = APIRouter(prefix="/shadow", tags=["Shadow Evaluation"])
+
+
+def _agreement(candidate_col, production_col):
+    # Averaged over successful samples only (NULL for failed ones)
+    return func.avg(
+        case(
+            (ShadowResult.error.is_not(None), None),
+            (candidate_col == production_col, 1.0),
+            else_=0.0,
+        )
+    )
+
+
+def _p(fraction: float, col):
+    return func.percentile_cont(fraction).within_group(col)
+
+
+def _per_min(mean_ms):
+    return round(60000 / mean_ms, 1) if mean_ms else None
+
+
+def _round(value, digits=3):
+    return round(value, digits) if value is not None else None
+
+
+@router.get("/report", response_model=List[ShadowCandidateReport])
+async def get_shadow_report(
+    days: int = Query(7, ge=1, le=90),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Agreement and latency of each shadow candidate against production
+    over the last `days` days.
+    """
+    since = datetime.utcnow() - timedelta(days=days)
+
+    result = await db.execute(
+        select(
+            ShadowResult.candidate,
+            func.count().label("samples"),
+            func.count(ShadowResult.error).label("errors"),
+            _agreement(ShadowResult.category, ShadowResult.production_category).label("category_agreement"),
+            _agreement(ShadowResult.urgency, ShadowResult.production_urgency).label("urgency_agreement"),
+            func.avg(
+                func.abs(ShadowResult.sentiment_score - ShadowResult.production_sentiment_score)
+            ).label("sentiment_mean_abs_diff"),
+            _p(0.5, ShadowResult.production_latency_ms).label("production_latency_p50_ms"),
+            _p(0.95, ShadowResult.production_latency_ms).label("production_latency_p95_ms"),
+            _p(0.5, ShadowResult.latency_ms).label("candidate_latency_p50_ms"),
+            _p(0.95, ShadowResult.latency_ms).label("candidate_latency_p95_ms"),
+            func.avg(ShadowResult.production_latency_ms).label("production_latency_mean"),
+            func.avg(ShadowResult.latency_ms).label("candidate_latency_mean"),
+        )
+        .where(ShadowResult.created_at >= since)
+        .group_by(ShadowResult.candidate)
+        .order_by(ShadowResult.candidate)
+    )
+
+    return [
+        ShadowCandidateReport(
+            candidate=row.candidate,
+            samples=row.samples,
+            errors=row.errors,
+            category_agreement=_round(row.category_agreement),
+            urgency_agreement=_round(row.urgency_agreement),
+            sentiment_mean_abs_diff=_round(row.sentiment_mean_abs_diff),
+            production_latency_p50_ms=_round(row.production_latency_p50_ms, 1),
+            production_latency_p95_ms=_round(row.production_latency_p95_ms, 1),
+            candidate_latency_p50_ms=_round(row.candidate_latency_p50_ms, 1),
+            candidate_latency_p95_ms=_round(row.candidate_latency_p95_ms, 1),
+            production_throughput_per_min=_per_min(row.production_latency_mean),
+            candidate_throughput_per_min=_per_min(row.candidate_latency_mean),
+        )
+        for row in result
+    ]
@@ -1,7 +1,11 @@
+import math
 from datetime import datetime
-from typing import List
-from fastapi import APIRouter, Depends, BackgroundTasks, status, HTTPException
-from sqlalchemy import select
+from typing import List, Optional
+from fastapi import APIRouter, Depends, BackgroundTasks, Header, status, HTTPException
+from sqlalchemy import select, union_all, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import defer
+from sqlalchemy.orm.exc import StaleDataError
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
@@ -12,17 +16,28 @@ from schemas.ticket import (
     TicketDetailResponse,
     TicketUpdateDraft,
 )
-from models.ticket import Ticket, TicketStatus
+from models.ticket import MergedRequestKey, Ticket, TicketArchive, TicketStatus
 from core.database import get_db
-from workers.ticket_processor import process_ticket
+from services.idempotency import header_key, content_keys, request_fingerprint
+from services.sender_limits import (
+    SENDER_MERGE_WINDOW,
+    find_merge_target,
+    merge_message,
+    retry_after,
+)
+from workers.ticket_processor import process_ticket, in_flight
 
 router = APIRouter(prefix="/tickets", tags=["Tickets"])
 
 
 @router.get("", response_model=List[TicketListItem])
 async def get_tickets(db: AsyncSession = Depends(get_db)):
+    # The list view never shows the text columns; skip fetching and
+    # decompressing them.
     result = await db.execute(
-        select(Ticket).order_by(Ticket.created_at.desc())
+        select(Ticket)
+        .options(defer(Ticket.message), defer(Ticket.ai_draft))
+        .order_by(Ticket.created_at.desc())
     )
     return result.scalars().all()
 
@@ -31,6 +46,10 @@ async def get_tickets(db: AsyncSession = Depends(get_db)):
 async def get_ticket(ticket_id: UUID, db: AsyncSession = Depends(get_db)):
     ticket = await db.get(Ticket, ticket_id)
 
+    if not ticket:
+        # Old resolved tickets live in the archive table
+        ticket = await db.get(TicketArchive, ticket_id)
+
     if not ticket:
         raise HTTPException(404, "Ticket not found")
 
@@ -41,19 +60,83 @@ async def get_ticket(ticket_id: UUID, db: AsyncSession = Depends(get_db)):
 async def create_ticket(
     payload: TicketCreate,
     background_tasks: BackgroundTasks,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
     db: AsyncSession = Depends(get_db),
 ):
+    """
+    Create a ticket. Retries carrying the same Idempotency-Key, or the same
+    email + message within IDEMPOTENCY_CONTENT_WINDOW, return the original
+    ticket instead of inserting and triaging it again.
+
+    Senders are rate limited per email (429), and with SENDER_MERGE_WINDOW
+    set, rapid follow-ups are merged into the sender's untriaged ticket.
+    """
+    if idempotency_key:
+        keys = [header_key(payload.email, idempotency_key)]
+    else:
+        keys = content_keys(payload.email, payload.message)
+
+    fingerprint = request_fingerprint(payload.email, payload.message)
+
+    if keys:
+        existing = await find_by_idempotency_key(db, keys, fingerprint)
+        if existing:
+            return existing
+
+    target = await find_merge_target(db, payload.email, exclude=in_flight)
+    if target and merge_message(target, payload.message):
+        if keys:
+            # So retries of this request find the ticket it was merged into
+            db.add(MergedRequestKey(
+                idempotency_key=keys[0],
+                request_fingerprint=fingerprint,
+                ticket_id=target.id,
+            ))
+        try:
+            await db.commit()
+            return {
+                "id": target.id,
+                "status": target.status,
+            }
+        except StaleDataError:
+            # Triage picked the ticket up meanwhile; open a new one instead
+            await db.rollback()
+        except IntegrityError:
+            # A concurrent retry of this request was merged first
+            await db.rollback()
+            existing = await find_by_idempotency_key(db, keys, fingerprint)
+            if not existing:
+                raise
+            return existing
+
+    wait = await retry_after(db, payload.email)
+    if wait is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many tickets from this sender, please wait before submitting again",
+            headers={"Retry-After": str(math.ceil(wait))},
+        )
+
     ticket = Ticket(
         email=payload.email,
         message=payload.message,
         status=TicketStatus.pending,
+        idempotency_key=keys[0] if keys else None,
+        request_fingerprint=fingerprint if keys else None,
     )
 
     db.add(ticket)
-    await db.commit()
-    await db.refresh(ticket)
-
-    background_tasks.add_task(process_ticket, ticket.id)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent retry inserted first; return its ticket
+        await db.rollback()
+        existing = await find_by_idempotency_key(db, keys, fingerprint)
+        if not existing:
+            raise
+        return existing
+
+    background_tasks.add_task(process_ticket, ticket.id, delay=SENDER_MERGE_WINDOW)
 
     return {
         "id": ticket.id,
@@ -61,42 +144,141 @@ async def create_ticket(
     }
 
 
+async def find_by_idempotency_key(db: AsyncSession, keys: list[str], fingerprint: str):
+    """
+    The original response for a replayed request, or None. A key reused
+    with a different body is rejected rather than silently replayed.
+    """
+    created = (
+        select(Ticket.id, Ticket.status, Ticket.request_fingerprint)
+        .where(Ticket.idempotency_key.in_(keys))
+    )
+    merged = (
+        select(Ticket.id, Ticket.status, MergedRequestKey.request_fingerprint)
+        .join(Ticket, Ticket.id == MergedRequestKey.ticket_id)
+        .where(MergedRequestKey.idempotency_key.in_(keys))
+    )
+
+    result = await db.execute(union_all(created, merged).limit(1))
+    row = result.first()
+
+    if not row:
+        return None
+
+    if row.request_fingerprint and row.request_fingerprint != fingerprint:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency-Key was already used with a different request body",
+        )
+
+    return {"id": row.id, "status": row.status}
+
+
+def expected_version(
+    if_match: Optional[str] = Header(None, alias="If-Match"),
+) -> Optional[int]:
+    """
+    Version the client last saw, from an If-Match header (`3`, `"3"` or `W/"3"`).
+    Without it, mutations only check the ticket's status.
+    """
+    if if_match is None:
+        return None
+
+    value = if_match.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+
+    try:
+        return int(value.strip('"'))
+    except ValueError:
+        raise HTTPException(400, "If-Match must be a ticket version")
+
+
+async def apply_update(
+    db: AsyncSession,
+    ticket_id: UUID,
+    version: Optional[int],
+    conditions: list,
+    values: dict,
+) -> Optional[Ticket]:
+    """
+    Single conditional UPDATE ... RETURNING. Returns None if the ticket is
+    missing, its version moved on, or `conditions` no longer hold.
+    """
+    stmt = (
+        update(Ticket)
+        .where(Ticket.id == ticket_id, *conditions)
+        .values(**values, version=Ticket.version + 1)
+        .returning(Ticket)
+    )
+    if version is not None:
+        stmt = stmt.where(Ticket.version == version)
+
+    result = await db.execute(stmt)
+    ticket = result.scalars().first()
+    await db.commit()
+
+    return ticket
+
+
+async def get_current_status(db: AsyncSession, ticket_id: UUID) -> TicketStatus:
+    """
+    Called after a failed conditional update to tell 404 from a conflict.
+    """
+    result = await db.execute(select(Ticket.status).where(Ticket.id == ticket_id))
+    current = result.scalar_one_or_none()
+
+    if current is None:
+        raise HTTPException(404, "Ticket not found")
+
+    return current
+
+
+def version_conflict() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Ticket was modified by someone else, reload and try again",
+    )
+
+
 @router.patch("/{ticket_id}/draft", response_model=TicketDetailResponse)
 async def update_ticket_draft(
     ticket_id: UUID,
     payload: TicketUpdateDraft,
+    version: Optional[int] = Depends(expected_version),
     db: AsyncSession = Depends(get_db),
 ):
-    ticket = await db.get(Ticket, ticket_id)
+    now = datetime.utcnow()
+    ticket = await apply_update(db, ticket_id, version, [], {
+        "ai_draft": payload.ai_draft,
+        "draft_edited_at": now,
+        "updated_at": now,
+    })
 
     if not ticket:
-        raise HTTPException(404, "Ticket not found")
-
-    ticket.ai_draft = payload.ai_draft
-    ticket.updated_at = datetime.utcnow()
-
-    await db.commit()
-    await db.refresh(ticket)
+        await get_current_status(db, ticket_id)
+        raise version_conflict()
 
     return ticket
 
 
 @router.patch("/{ticket_id}/resolve", response_model=TicketDetailResponse)
-async def resolve_ticket(ticket_id: UUID, db: AsyncSession = Depends(get_db)):
-    ticket = await db.get(Ticket, ticket_id)
+async def resolve_ticket(
+    ticket_id: UUID,
+    version: Optional[int] = Depends(expected_version),
+    db: AsyncSession = Depends(get_db),
+):
+    now = datetime.utcnow()
+    ticket = await apply_update(
+        db, ticket_id, version,
+        [Ticket.status != TicketStatus.resolved],
+        {"status": TicketStatus.resolved, "resolved_at": now, "updated_at": now},
+    )
 
     if not ticket:
-        raise HTTPException(404, "Ticket not found")
-
-    if ticket.status == TicketStatus.resolved:
-        raise HTTPException(400, "Ticket already resolved")
-
-    ticket.status = TicketStatus.resolved
-    ticket.resolved_at = datetime.utcnow()
-    ticket.updated_at = datetime.utcnow()
-
-    await db.commit()
-    await db.refresh(ticket)
+        if await get_current_status(db, ticket_id) == TicketStatus.resolved:
+            raise HTTPException(400, "Ticket already resolved")
+        raise version_conflict()
 
     return ticket
 
@@ -128,31 +310,31 @@ async def delete_ticket(
 @router.put("/{ticket_id}/reopen", response_model=TicketDetailResponse)
 async def reopen_ticket(
     ticket_id: UUID,
+    background_tasks: BackgroundTasks,
+    version: Optional[int] = Depends(expected_version),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Reopen a resolved ticket
+    Reopen a resolved ticket and run triage again
     """
-    result = await db.execute(
-        select(Ticket).where(Ticket.id == ticket_id)
+    ticket = await apply_update(
+        db, ticket_id, version,
+        [Ticket.status == TicketStatus.resolved],
+        {
+            "status": TicketStatus.pending,
+            "resolved_at": None,
+            "updated_at": datetime.utcnow(),
+        },
     )
-    ticket = result.scalars().first()
 
     if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Ticket with ID {ticket_id} not found"
-        )
-
-    if ticket.status != TicketStatus.resolved:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only resolved tickets can be reopened"
-        )
+        if await get_current_status(db, ticket_id) != TicketStatus.resolved:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only resolved tickets can be reopened"
+            )
+        raise version_conflict()
 
-    ticket.status = TicketStatus.pending
-    
-    await db.commit()
-    await db.refresh(ticket)
+    background_tasks.add_task(process_ticket, ticket.id)
 
-    return ticket
\ No newline at end of file
+    return ticket
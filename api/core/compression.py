@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import os
+
+from sqlalchemy import LargeBinary, select
+from sqlalchemy.types import TypeDecorator
+
+from core.database import AsyncSessionLocal
+from models.zstd_dictionary import ZstdDictionary
+
+logger = logging.getLogger(__name__)
+
+# off  -> store UTF-8 as-is (still readable if rows were compressed earlier)
+# zstd -> compress new writes, using the current trained dictionary if any
+TEXT_COMPRESSION = os.getenv("TEXT_COMPRESSION", "off").lower()
+ZSTD_LEVEL = int(os.getenv("ZSTD_LEVEL", "3"))
+# Dictionaries live in the zstd_dictionaries table; running instances
+# re-read it this often to pick up newly trained ones.
+ZSTD_DICT_REFRESH = int(os.getenv("ZSTD_DICT_REFRESH", "60"))
+
+# First byte of every stored value
+TAG_PLAIN = b"\x00"
+TAG_ZSTD = b"\x01"
+
+
+def _zstandard():
+    # Imported on first use so deployments without compression never load it
+    try:
+        import zstandard
+    except ImportError:  # optional dependency, only needed for TEXT_COMPRESSION=zstd
+        return None
+    return zstandard
+
+
+class _Codec:
+    def __init__(self):
+        self._compressor = None
+        self._decompressors = {}
+        self._dicts = {}
+        self._current_id = None
+
+    def has_dict(self, dict_id: int) -> bool:
+        return dict_id in self._dicts
+
+    def load(self, dicts: dict, current_id: int | None) -> None:
+        """
+        Add dictionaries read by load_dictionaries() and switch new writes
+        to `current_id`. Known dictionaries never change, so they're kept.
+        """
+        zstandard = _zstandard()
+        for dict_id, data in dicts.items():
+            self._dicts[dict_id] = zstandard.ZstdCompressionDict(data)
+
+        if current_id != self._current_id:
+            self._current_id = current_id
+            self._compressor = None
+
+    def _current_dict(self):
+        if self._current_id is None:
+            return None
+
+        dict_data = self._dicts.get(self._current_id)
+        if dict_data is None:
+            raise RuntimeError(f"Current zstd dictionary {self._current_id} is not loaded")
+        return dict_data
+
+    def _get_compressor(self):
+        if self._compressor is None:
+            zstandard = _zstandard()
+            if zstandard is None:
+                raise RuntimeError("TEXT_COMPRESSION=zstd requires the 'zstandard' package")
+
+            self._compressor = zstandard.ZstdCompressor(
+                level=ZSTD_LEVEL,
+                dict_data=self._current_dict(),
+            )
+        return self._compressor
+
+    def _get_decompressor(self, dict_id: int):
+        if dict_id not in self._decompressors:
+            dict_data = None
+            if dict_id:
+                dict_data = self._dicts.get(dict_id)
+                if dict_data is None:
+                    raise RuntimeError(f"zstd dictionary {dict_id} not found in zstd_dictionaries")
+
+            self._decompressors[dict_id] = _zstandard().ZstdDecompressor(dict_data=dict_data)
+        return self._decompressors[dict_id]
+
+    def encode(self, text: str, mode: str = TEXT_COMPRESSION) -> bytes:
+        raw = text.encode("utf-8")
+
+        if mode == "zstd":
+            compressed = self._get_compressor().compress(raw)
+            # Tiny strings can grow under zstd; keep whichever is smaller
+            if len(compressed) < len(raw):
+                return TAG_ZSTD + compressed
+
+        return TAG_PLAIN + raw
+
+    def decode(self, value: bytes) -> str:
+        tag, body = value[:1], value[1:]
+
+        if tag == TAG_ZSTD:
+            zstandard = _zstandard()
+            if zstandard is None:
+                raise RuntimeError("Reading compressed text requires the 'zstandard' package")
+
+            dict_id = zstandard.get_frame_parameters(body).dict_id
+            return self._get_decompressor(dict_id).decompress(body).decode("utf-8")
+
+        return body.decode("utf-8")
+
+
+codec = _Codec()
+
+
+async def load_dictionaries() -> None:
+    """
+    Load dictionaries the codec doesn't have yet, and the current one.
+    Without zstandard there's nothing to decode with, so it's a no-op.
+    """
+    if _zstandard() is None:
+        return
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(ZstdDictionary.dict_id, ZstdDictionary.is_current))
+        rows = result.all()
+
+        new_ids = [row.dict_id for row in rows if not codec.has_dict(row.dict_id)]
+        new_dicts = {}
+        if new_ids:
+            result = await db.execute(
+                select(ZstdDictionary.dict_id, ZstdDictionary.data)
+                .where(ZstdDictionary.dict_id.in_(new_ids))
+            )
+            new_dicts = dict(result.all())
+
+    current_id = next((row.dict_id for row in rows if row.is_current), None)
+    codec.load(new_dicts, current_id)
+
+    if new_dicts:
+        logger.info("Loaded %d zstd dictionaries (current: %s)", len(new_dicts), current_id)
+
+
+async def run_dict_refresh_loop() -> None:
+    """
+    Load dictionaries on startup, then every ZSTD_DICT_REFRESH seconds.
+    """
+    while True:
+        try:
+            await load_dictionaries()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Loading zstd dictionaries failed")
+
+        await asyncio.sleep(ZSTD_DICT_REFRESH)
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text column stored as bytea, optionally zstd-compressed.
+    Reads and writes plain `str`, so models and schemas are unaffected.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return codec.encode(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return codec.decode(bytes(value))
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+logger = logging.getLogger(__name__)
+
+# inline  -> run on the event loop (default, no extra processes)
+# thread  -> ThreadPoolExecutor, for work that releases the GIL
+# process -> ProcessPoolExecutor, for pure-Python CPU work
+CPU_POOL_MODE = os.getenv("CPU_POOL_MODE", "inline").lower()
+CPU_POOL_WORKERS = int(os.getenv("CPU_POOL_WORKERS", str(os.cpu_count() or 2)))
+CPU_BATCH_SIZE = int(os.getenv("CPU_BATCH_SIZE", "32"))
+# How long run_cpu_batched waits to collect more calls before submitting
+CPU_BATCH_WINDOW_MS = float(os.getenv("CPU_BATCH_WINDOW_MS", "5"))
+
+_executor: Executor | None = None
+
+# fn -> [(item, future)] waiting to be submitted together
+_pending: dict = {}
+# The loop only keeps weak references to tasks; hold running flushes here
+# so one isn't garbage-collected while callers wait on its futures.
+_flush_tasks: set = set()
+
+
+def get_executor() -> Executor | None:
+    """
+    Lazily create the configured executor. Returns None in inline mode.
+    """
+    global _executor
+
+    if _executor is not None or CPU_POOL_MODE == "inline":
+        return _executor
+
+    if CPU_POOL_MODE == "process":
+        _executor = ProcessPoolExecutor(max_workers=CPU_POOL_WORKERS)
+    elif CPU_POOL_MODE == "thread":
+        _executor = ThreadPoolExecutor(
+            max_workers=CPU_POOL_WORKERS,
+            thread_name_prefix="cpu-pool",
+        )
+    else:
+        raise ValueError(f"Unknown CPU_POOL_MODE: {CPU_POOL_MODE}")
+
+    logger.info("Started %s CPU pool with %d workers", CPU_POOL_MODE, CPU_POOL_WORKERS)
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def _apply_batch(fn, items: list) -> list:
+    # Runs inside the pool: one submission (and one pickle round trip) per batch.
+    return [fn(item) for item in items]
+
+
+def _capture(fn, item):
+    # Per-item outcome, so one failing item doesn't fail its whole batch
+    try:
+        return True, fn(item)
+    except Exception as e:
+        return False, e
+
+
+async def run_cpu_batch(fn, items: list, batch_size: int = CPU_BATCH_SIZE) -> list:
+    """
+    Map `fn` over `items` in the pool, submitting `batch_size` items per task.
+    Results keep the input order.
+    """
+    if not items:
+        return []
+
+    executor = get_executor()
+
+    if executor is None:
+        return _apply_batch(fn, items)
+
+    loop = asyncio.get_running_loop()
+    chunks = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    results = await asyncio.gather(*[
+        loop.run_in_executor(executor, _apply_batch, fn, chunk)
+        for chunk in chunks
+    ])
+
+    return [item for chunk in results for item in chunk]
+
+
+async def _flush(fn) -> None:
+    batch = _pending.pop(fn, None)
+    if not batch:
+        return
+
+    try:
+        outcomes = await run_cpu_batch(partial(_capture, fn), [item for item, _ in batch])
+    except Exception as e:
+        # Pool-level failure (e.g. a worker process died)
+        outcomes = [(False, e)] * len(batch)
+
+    for (_, future), (ok, value) in zip(batch, outcomes):
+        if future.done():
+            continue
+        if ok:
+            future.set_result(value)
+        else:
+            future.set_exception(value)
+
+
+def _start_flush(fn) -> None:
+    task = asyncio.create_task(_flush(fn))
+    _flush_tasks.add(task)
+    task.add_done_callback(_flush_tasks.discard)
+
+
+async def run_cpu_batched(fn, item):
+    """
+    Run `fn(item)` off the event loop. Concurrent calls for the same `fn`
+    arriving within CPU_BATCH_WINDOW_MS are submitted to the pool together
+    (up to CPU_BATCH_SIZE), so small per-ticket work shares one IPC round trip.
+
+    In process mode `fn` must be a module-level function and `item` and
+    the result must be picklable.
+    """
+    if get_executor() is None:
+        return fn(item)
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    batch = _pending.setdefault(fn, [])
+    batch.append((item, future))
+
+    if len(batch) >= CPU_BATCH_SIZE:
+        _start_flush(fn)
+    elif len(batch) == 1:
+        loop.call_later(CPU_BATCH_WINDOW_MS / 1000, _start_flush, fn)
+
+    return await future
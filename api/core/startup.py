@@ -0,0 +1,74 @@
+import asyncio
+import logging
+import os
+import time
+
+from sqlalchemy import text
+
+from core.database import engine
+
+logger = logging.getLogger(__name__)
+
+# Connections opened before the first request (SQLAlchemy's default pool_size is 5)
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", "5"))
+# Upper bound on the warm-up, so an unreachable DB can't hold back readiness
+DB_POOL_WARM_TIMEOUT = float(os.getenv("DB_POOL_WARM_TIMEOUT", "2"))
+LLM_PRELOAD = os.getenv("LLM_PRELOAD", "true").lower() == "true"
+
+# Timings in ms, served by GET /metrics/startup
+startup_report: dict = {
+    "imports_ms": None,
+    "db_warm_ms": None,
+    "ready_ms": None,
+    "llm_warm_ms": None,
+    "llm_warm_error": None,
+}
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+async def warm_db_pool() -> None:
+    """
+    Open DB_POOL_WARM connections concurrently so they're pooled before
+    traffic arrives instead of being created on the first requests.
+    """
+    started = time.perf_counter()
+
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*[ping() for _ in range(DB_POOL_WARM)]),
+            timeout=DB_POOL_WARM_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        logger.warning("DB pool warm-up timed out after %.1f s", DB_POOL_WARM_TIMEOUT)
+    except Exception:
+        # Don't block startup on the DB; requests will retry the connection
+        logger.exception("DB pool warm-up failed")
+
+    startup_report["db_warm_ms"] = _elapsed_ms(started)
+
+
+async def warm_llm() -> None:
+    """
+    Preload the triage model. Runs in the background: loading can take
+    longer than we want to hold back readiness.
+    """
+    # Deferred so the service module (and httpx) load after the app is up
+    from services.ai_triage import preload_model
+
+    started = time.perf_counter()
+
+    try:
+        await preload_model()
+    except Exception as e:
+        logger.warning("LLM preload failed: %s", e)
+        startup_report["llm_warm_error"] = str(e)
+
+    startup_report["llm_warm_ms"] = _elapsed_ms(started)
+    logger.info("LLM warm-up finished in %.1f ms", startup_report["llm_warm_ms"])
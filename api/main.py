@@ -1,8 +1,59 @@
+import time
+
+_started = time.perf_counter()
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from controllers.ticket import router as ticket_router
+from controllers.metrics import router as metrics_router
+from controllers.shadow import router as shadow_router
+from core.compression import run_dict_refresh_loop
+from core.cpu_pool import get_executor, shutdown_executor
+from core.loop_monitor import loop_monitor
+from core.startup import LLM_PRELOAD, startup_report, warm_db_pool, warm_llm
+from workers.recovery import run_recovery_loop
+from workers.shadow import run_shadow_worker
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI(title="AI Support Triage API")
+logger = logging.getLogger(__name__)
+
+startup_report["imports_ms"] = round((time.perf_counter() - _started) * 1000, 1)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_executor()
+    loop_monitor.start()
+
+    # Dictionaries load alongside the pool warm-up rather than after it
+    background = [asyncio.create_task(run_dict_refresh_loop())]
+    await warm_db_pool()
+
+    background += [
+        asyncio.create_task(run_recovery_loop()),
+        asyncio.create_task(run_shadow_worker()),
+    ]
+    if LLM_PRELOAD:
+        background.append(asyncio.create_task(warm_llm()))
+
+    startup_report["ready_ms"] = round((time.perf_counter() - _started) * 1000, 1)
+    logger.info("API ready in %.1f ms", startup_report["ready_ms"])
+
+    yield
+
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+    await loop_monitor.stop()
+    shutdown_executor()
+
+    from services.ai_triage import close_client
+    await close_client()
+
+
+app = FastAPI(title="AI Support Triage API", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:3001"],
@@ -12,3 +63,5 @@ app.add_middleware(
 )
 
 app.include_router(ticket_router)
+app.include_router(metrics_router)
+app.include_router(shadow_router)
@@ -0,0 +1,48 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import String, Text, Integer, Float, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from core.database import Base
+
+
+class ShadowResult(Base):
+    """
+    A candidate model's triage of a ticket, stored next to what production
+    decided so the two can be compared (see workers/shadow.py).
+    """
+    __tablename__ = "triage_shadow_results"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+
+    # No foreign key: results must survive tickets being archived or deleted
+    ticket_id: Mapped[uuid.UUID] = mapped_column(nullable=False, index=True)
+
+    # Label for the candidate: model name, plus prompt name if overridden
+    candidate: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    # Production result at the time of comparison
+    production_category: Mapped[str] = mapped_column(String(32), nullable=False)
+    production_urgency: Mapped[str] = mapped_column(String(32), nullable=False)
+    production_sentiment_score: Mapped[int] = mapped_column(Integer, nullable=False)
+    production_latency_ms: Mapped[float] = mapped_column(Float, nullable=False)
+
+    # Candidate result; NULL when the candidate failed (see error)
+    category: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    urgency: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    sentiment_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    draft_reply: Mapped[str | None] = mapped_column(Text, nullable=True)
+    latency_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False
+    )
+
+    __table_args__ = (
+        Index('idx_shadow_candidate_created', 'candidate', 'created_at'),
+    )
+
+    def __repr__(self):
+        return f"<ShadowResult(ticket_id={self.ticket_id}, candidate={self.candidate})>"
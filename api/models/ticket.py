@@ -1,8 +1,9 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Enum, Integer, DateTime, Index
+from sqlalchemy import String, Enum, Integer, DateTime, Index, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 from core.database import Base
+from core.compression import CompressedText
 import enum
 
 
@@ -40,7 +41,20 @@ class Ticket(Base):
         nullable=False,
         index=True
     )
-    message: Mapped[str] = mapped_column(Text, nullable=False)
+    message: Mapped[str] = mapped_column(CompressedText, nullable=False)
+
+    # sha256 of the Idempotency-Key header or of email + message, see
+    # services/idempotency.py. Unique so concurrent retries can't both insert.
+    idempotency_key: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        unique=True
+    )
+    # sha256 of email + message for the request that set idempotency_key
+    request_fingerprint: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True
+    )
 
     category: Mapped[Category | None] = mapped_column(
         Enum(Category), 
@@ -57,7 +71,12 @@ class Ticket(Base):
         index=True
     )
 
-    ai_draft: Mapped[str | None] = mapped_column(Text, nullable=True)
+    ai_draft: Mapped[str | None] = mapped_column(CompressedText, nullable=True)
+    # Set when an agent edits the draft; triage never overwrites it afterwards
+    draft_edited_at: Mapped[datetime | None] = mapped_column(
+        DateTime,
+        nullable=True
+    )
 
     status: Mapped[TicketStatus] = mapped_column(
         Enum(TicketStatus), 
@@ -83,11 +102,21 @@ class Ticket(Base):
         nullable=True
     )
 
+    # Bumped on every mutation; writers compare it to detect lost updates
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="1"
+    )
+
     __table_args__ = (
         Index('idx_status_created', 'status', 'created_at'),
         Index('idx_urgency_status', 'urgency', 'status'),
+        Index('idx_status_resolved', 'status', 'resolved_at'),
     )
 
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self):
         return f"<Ticket(id={self.id}, email={self.email}, status={self.status})>"
 
@@ -100,4 +129,72 @@ class Ticket(Base):
         return self.status == TicketStatus.pending
 
     def is_high_priority(self) -> bool:
-        return self.urgency == Urgency.high
\ No newline at end of file
+        return self.urgency == Urgency.high
+
+class MergedRequestKey(Base):
+    """
+    Idempotency key of a request that was merged into an existing ticket
+    (services/sender_limits.py) instead of creating one, so its retries
+    return that ticket rather than opening a new one.
+    """
+    __tablename__ = "merged_request_keys"
+
+    idempotency_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    request_fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    ticket_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("tickets.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False
+    )
+
+    def __repr__(self):
+        return f"<MergedRequestKey(ticket_id={self.ticket_id})>"
+
+
+class TicketArchive(Base):
+    """
+    Resolved tickets moved out of the hot `tickets` table by
+    utils/archive_resolved.py. Same shape as Ticket plus archived_at.
+    """
+    __tablename__ = "tickets_archive"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+
+    email: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        index=True
+    )
+    message: Mapped[str] = mapped_column(CompressedText, nullable=False)
+
+    category: Mapped[Category | None] = mapped_column(Enum(Category), nullable=True)
+    sentiment_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    urgency: Mapped[Urgency | None] = mapped_column(Enum(Urgency), nullable=True)
+
+    ai_draft: Mapped[str | None] = mapped_column(CompressedText, nullable=True)
+
+    status: Mapped[TicketStatus] = mapped_column(
+        Enum(TicketStatus),
+        nullable=False
+    )
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    resolved_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+        index=True
+    )
+
+    def __repr__(self):
+        return f"<TicketArchive(id={self.id}, email={self.email}, archived_at={self.archived_at})>"
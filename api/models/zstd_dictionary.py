@@ -0,0 +1,35 @@
+from datetime import datetime
+from sqlalchemy import BigInteger, Boolean, DateTime, LargeBinary, false
+from sqlalchemy.orm import Mapped, mapped_column
+from core.database import Base
+
+
+class ZstdDictionary(Base):
+    """
+    Trained zstd dictionaries (utils/train_zstd_dict.py), stored with the
+    data so backups, restores and replicas can always read compressed rows.
+    Old dictionaries must be kept: each frame records the id it was written with.
+    """
+    __tablename__ = "zstd_dictionaries"
+
+    # zstd's own dictionary id (a content hash, not sequential)
+    dict_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    # The dictionary used for new writes; training moves it to the new row
+    is_current: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default=false()
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False
+    )
+
+    def __repr__(self):
+        return f"<ZstdDictionary(dict_id={self.dict_id}, is_current={self.is_current})>"
@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class ShadowCandidateReport(BaseModel):
+    """Production vs candidate comparison for one shadow candidate"""
+    candidate: str
+    samples: int
+    errors: int
+    category_agreement: Optional[float] = None  # share of successful samples, 0-1
+    urgency_agreement: Optional[float] = None
+    sentiment_mean_abs_diff: Optional[float] = None
+    production_latency_p50_ms: Optional[float] = None
+    production_latency_p95_ms: Optional[float] = None
+    candidate_latency_p50_ms: Optional[float] = None
+    candidate_latency_p95_ms: Optional[float] = None
+    # Sequential tickets per minute implied by mean latency
+    production_throughput_per_min: Optional[float] = None
+    candidate_throughput_per_min: Optional[float] = None
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "candidate": "phi3:mini",
+                "samples": 240,
+                "errors": 3,
+                "category_agreement": 0.91,
+                "urgency_agreement": 0.84,
+                "sentiment_mean_abs_diff": 1.2,
+                "production_latency_p50_ms": 4200.0,
+                "production_latency_p95_ms": 7900.0,
+                "candidate_latency_p50_ms": 1500.0,
+                "candidate_latency_p95_ms": 2600.0,
+                "production_throughput_per_min": 13.1,
+                "candidate_throughput_per_min": 37.5
+            }
+        }
+    }
@@ -102,6 +102,7 @@ class TicketDetailResponse(BaseModel):
     created_at: datetime  # 👈 TAMBAHAN
     updated_at: Optional[datetime] = None  # 👈 TAMBAHAN
     resolved_at: Optional[datetime] = None  # 👈 TAMBAHAN: track resolution time
+    version: Optional[int] = None  # send back as If-Match on mutations; None for archived tickets
 
     model_config = {
         "from_attributes": True,
@@ -117,7 +118,8 @@ class TicketDetailResponse(BaseModel):
                 "status": "processed",
                 "created_at": "2024-01-15T10:30:00Z",
                 "updated_at": "2024-01-15T11:00:00Z",
-                "resolved_at": None
+                "resolved_at": None,
+                "version": 2
             }
         }
     }
@@ -1,11 +1,20 @@
-import httpx
 import json
 import logging
+import os
 from schemas.ticket import AITriageResult, TicketCategory, TicketUrgency
+from services.message_compactor import compact_message
+from core.cpu_pool import run_cpu_batched
 
 logger = logging.getLogger(__name__)
 
 OLLAMA_URL = "http://localhost:11434/api/generate"
+OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "mistral")
+
+# Keep the model (and its KV cache for the static system prompt) resident
+# between tickets so Ollama only evaluates the customer message each call.
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+_client = None
 
 SYSTEM_PROMPT = """
 You are a customer support triage system.
@@ -56,22 +65,11 @@ def extract_json(raw_text: str) -> dict:
     return json.loads(raw_text[start:end])
 
 
-# =========================
-# Main AI Triage Function
-# =========================
-async def run_ai_triage(message: str) -> AITriageResult:
-    payload = {
-        "model": "mistral",
-        "prompt": f"{SYSTEM_PROMPT}\n\nCustomer complaint:\n{message}",
-        "stream": False,
-    }
-
-    async with httpx.AsyncClient(timeout=120) as client:
-        response = await client.post(OLLAMA_URL, json=payload)
-
-    response.raise_for_status()
-
-    raw_text = response.json().get("response", "")
+def parse_triage_response(raw_text: str) -> AITriageResult:
+    """
+    Turn raw model output into a validated AITriageResult.
+    Pure function so it can run in the CPU pool.
+    """
     parsed = extract_json(raw_text)
 
     # =========================
@@ -92,3 +90,83 @@ async def run_ai_triage(message: str) -> AITriageResult:
         parsed["urgency"] = TicketUrgency.medium
 
     return AITriageResult(**parsed)
+
+
+def get_client():
+    """
+    Shared HTTP client so calls reuse the connection to Ollama.
+    httpx is imported here rather than at module load to keep it off the
+    API's startup path.
+    """
+    global _client
+
+    if _client is None:
+        import httpx
+
+        _client = httpx.AsyncClient(timeout=120)
+
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def preload_model() -> None:
+    """
+    Load the model into Ollama and evaluate SYSTEM_PROMPT once, so the
+    first real ticket doesn't pay for either.
+    """
+    payload = {
+        "model": OLLAMA_MODEL,
+        "system": SYSTEM_PROMPT,
+        "prompt": "Customer complaint:\n",
+        "stream": False,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
+        "options": {"num_predict": 1},
+    }
+
+    response = await get_client().post(OLLAMA_URL, json=payload)
+    response.raise_for_status()
+
+
+# =========================
+# Main AI Triage Function
+# =========================
+async def run_ai_triage(
+    message: str,
+    model: str = OLLAMA_MODEL,
+    system_prompt: str = SYSTEM_PROMPT,
+    url: str = OLLAMA_URL,
+    keep_alive: str | int = OLLAMA_KEEP_ALIVE,
+) -> AITriageResult:
+    """
+    Triage a message. model/system_prompt/url/keep_alive default to
+    production and are overridden by shadow evaluation (workers/shadow.py).
+    """
+    # Pre- and post-processing are CPU-bound; run_cpu_batched keeps them off
+    # the event loop when CPU_POOL_MODE is thread/process, batching
+    # concurrent tickets into one pool submission.
+    compacted = await run_cpu_batched(compact_message, message)
+
+    # SYSTEM_PROMPT goes in its own field and never changes, so the
+    # evaluated prefix is identical across calls and can be reused.
+    payload = {
+        "model": model,
+        "system": system_prompt,
+        "prompt": f"Customer complaint:\n{compacted}",
+        "stream": False,
+        "keep_alive": keep_alive,
+    }
+
+    response = await get_client().post(url, json=payload)
+
+    response.raise_for_status()
+
+    raw_text = response.json().get("response", "")
+
+    return await run_cpu_batched(parse_triage_response, raw_text)
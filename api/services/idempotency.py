@@ -0,0 +1,46 @@
+import hashlib
+import os
+import time
+
+# Identical email + message within this many seconds is treated as a retry
+# even without an Idempotency-Key header. 0 disables content deduplication.
+IDEMPOTENCY_CONTENT_WINDOW = int(os.getenv("IDEMPOTENCY_CONTENT_WINDOW", "300"))
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def header_key(email: str, key: str) -> str:
+    """
+    Scope a client-supplied Idempotency-Key to the sender so two customers
+    can't collide on the same key.
+    """
+    return _digest("header", email.lower(), key)
+
+
+def request_fingerprint(email: str, message: str) -> str:
+    """
+    Hash of the request body, stored with the key so a reused
+    Idempotency-Key with a different body can be rejected.
+    """
+    return _digest("body", email.lower(), " ".join(message.split()))
+
+
+def content_keys(email: str, message: str, now: float | None = None) -> list[str]:
+    """
+    Dedup keys for the current and previous time bucket.
+
+    The first key is the one to store. Checking the previous bucket too means
+    a retry that straddles a bucket boundary is still caught.
+    """
+    if IDEMPOTENCY_CONTENT_WINDOW <= 0:
+        return []
+
+    bucket = int((now or time.time()) // IDEMPOTENCY_CONTENT_WINDOW)
+    normalized = " ".join(message.split())
+
+    return [
+        _digest("content", email.lower(), normalized, str(b))
+        for b in (bucket, bucket - 1)
+    ]
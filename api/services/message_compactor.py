@@ -0,0 +1,132 @@
+import os
+import re
+
+# Rough chars-per-token ratio for English/Indonesian text on Mistral's tokenizer.
+# Good enough for budgeting without loading a tokenizer in the API process.
+CHARS_PER_TOKEN = 4
+
+MAX_MESSAGE_TOKENS = int(os.getenv("TRIAGE_MAX_MESSAGE_TOKENS", "768"))
+
+TRUNCATION_MARKER = "\n[...]"
+
+# Joins follow-up messages merged into one ticket (services/sender_limits.py).
+# Each segment is a separate email and is compacted on its own.
+MERGE_SEPARATOR = "\n\n---\n\n"
+
+# Lines that start a quoted reply; everything after them is history.
+_REPLY_HEADERS = [
+    re.compile(r"^\s*On .{0,200}wrote:\s*$", re.IGNORECASE),
+    re.compile(r"^\s*Pada .{0,200}menulis:\s*$", re.IGNORECASE),
+]
+
+# Lines that start an embedded (forwarded or copied) email. Its body is
+# kept when the customer wrote next to nothing above it ("fwd", "see below").
+_FORWARD_HEADERS = [
+    re.compile(r"^\s*-{2,}\s*Original Message\s*-{2,}\s*$", re.IGNORECASE),
+    re.compile(r"^\s*-{2,}\s*Forwarded message\s*-{2,}\s*$", re.IGNORECASE),
+    re.compile(r"^\s*_{10,}\s*$"),
+]
+_MIN_NOTE_CHARS = 40
+
+# Lines that start a signature or legal footer; everything after them is noise.
+_SIGNATURE_MARKERS = [
+    # RFC 3676 delimiter only; a bare "--" is often part of the message
+    re.compile(r"^-- $"),
+    re.compile(r"^\s*Sent from my .+$", re.IGNORECASE),
+    re.compile(r"^\s*Dikirim dari .+$", re.IGNORECASE),
+    re.compile(r"^\s*(CONFIDENTIALITY NOTICE|DISCLAIMER)\b.*$", re.IGNORECASE),
+]
+
+# "From:" only starts quoted history when email headers follow it;
+# otherwise it's ordinary text ("From: yesterday the app crashes...").
+_FROM_HEADER = re.compile(r"^\s*(From|Dari):\s.+$", re.IGNORECASE)
+_FOLLOWING_HEADER = re.compile(r"^\s*(Sent|Date|To|Subject|Cc|Tanggal|Kepada|Subjek):\s", re.IGNORECASE)
+_HEADER_LOOKAHEAD = 4
+_ANY_HEADER = re.compile(r"^\s*(From|Dari|Sent|Date|To|Subject|Cc|Tanggal|Kepada|Subjek):", re.IGNORECASE)
+
+_QUOTED_LINE = re.compile(r"^\s*>")
+_BLANK_RUN = re.compile(r"\n{3,}")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap token estimate used for prompt budgeting.
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _is_header_block(lines: list[str], i: int) -> bool:
+    if not _FROM_HEADER.match(lines[i]):
+        return False
+
+    following = [line for line in lines[i + 1:i + 1 + _HEADER_LOOKAHEAD] if line.strip()]
+    return bool(following) and _FOLLOWING_HEADER.match(following[0]) is not None
+
+
+def _skip_headers(lines: list[str]) -> list[str]:
+    # Drop the From:/Date:/Subject: block at the top of an embedded email
+    for i, line in enumerate(lines):
+        if line.strip() and not _ANY_HEADER.match(line):
+            return lines[i:]
+    return []
+
+
+def _tidy(lines: list[str]) -> str:
+    return _BLANK_RUN.sub("\n\n", "\n".join(lines)).strip()
+
+
+def strip_boilerplate(message: str) -> str:
+    """
+    Drop quoted replies, forwarded history and signatures from an email body.
+    """
+    kept = []
+    lines = message.splitlines()
+
+    for i, line in enumerate(lines):
+        if any(p.match(line) for p in _REPLY_HEADERS + _SIGNATURE_MARKERS):
+            break
+        if any(p.match(line) for p in _FORWARD_HEADERS) or _is_header_block(lines, i):
+            note = _tidy(kept)
+            if len(note) < _MIN_NOTE_CHARS:
+                # The complaint is in the embedded email, not above it
+                forwarded = strip_boilerplate("\n".join(_skip_headers(lines[i + 1:])))
+                return "\n\n".join(part for part in (note, forwarded) if part)
+            break
+        if _QUOTED_LINE.match(line):
+            continue
+        kept.append(line.rstrip())
+
+    return _tidy(kept)
+
+
+def truncate_to_budget(text: str, max_tokens: int) -> str:
+    """
+    Cut text to roughly max_tokens, preferring a word boundary.
+    """
+    if max_tokens <= 0 or estimate_tokens(text) <= max_tokens:
+        return text
+
+    # Tiny budgets leave no room for text once the marker is counted
+    limit = max(0, max_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER))
+    cut = text[:limit]
+    space = cut.rfind(" ")
+    if space > limit // 2:
+        cut = cut[:space]
+
+    return cut.rstrip() + TRUNCATION_MARKER
+
+
+def compact_message(message: str, max_tokens: int = MAX_MESSAGE_TOKENS) -> str:
+    """
+    Prepare a customer message for the LLM prompt.
+
+    Merged follow-ups are stripped one by one, so a signature or quoted
+    reply in an earlier message doesn't hide the later ones. A segment
+    falls back to its raw text if stripping would leave nothing.
+    """
+    segments = [
+        strip_boilerplate(segment) or segment.strip()
+        for segment in message.split(MERGE_SEPARATOR)
+    ]
+    compacted = MERGE_SEPARATOR.join(segment for segment in segments if segment)
+    return truncate_to_budget(compacted, max_tokens)
@@ -0,0 +1,101 @@
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.ticket import Ticket, TicketStatus
+from services.message_compactor import MERGE_SEPARATOR
+
+# Token bucket per sender: SENDER_BUCKET_CAPACITY tickets in a burst, refilled
+# at SENDER_REFILL_PER_MINUTE. A refill rate of 0 disables the limiter.
+SENDER_BUCKET_CAPACITY = int(os.getenv("SENDER_BUCKET_CAPACITY", "5"))
+SENDER_REFILL_PER_MINUTE = float(os.getenv("SENDER_REFILL_PER_MINUTE", "1"))
+
+# When > 0, a new message from a sender whose previous ticket is still
+# untriaged and younger than this many seconds is appended to that ticket,
+# and triage is delayed by the same window so the merged text is triaged once.
+SENDER_MERGE_WINDOW = int(os.getenv("SENDER_MERGE_WINDOW", "0"))
+MAX_MERGED_LENGTH = 20000
+
+
+async def retry_after(db: AsyncSession, email: str) -> float | None:
+    """
+    Seconds until the sender may create another ticket, or None if allowed.
+
+    The bucket is rebuilt from the sender's recent created_at values
+    (served by ix_tickets_email), so it holds across replicas without
+    shared state. History older than one full refill can't affect the
+    result, so only that window is read.
+    """
+    if SENDER_REFILL_PER_MINUTE <= 0:
+        return None
+
+    rate = SENDER_REFILL_PER_MINUTE / 60
+    now = datetime.utcnow()
+    since = now - timedelta(seconds=SENDER_BUCKET_CAPACITY / rate)
+
+    result = await db.execute(
+        select(Ticket.created_at)
+        .where(Ticket.email == email, Ticket.created_at >= since)
+        .order_by(Ticket.created_at)
+    )
+
+    tokens = float(SENDER_BUCKET_CAPACITY)
+    last = since
+    for created_at in result.scalars():
+        tokens = min(SENDER_BUCKET_CAPACITY, tokens + (created_at - last).total_seconds() * rate)
+        tokens -= 1
+        last = created_at
+
+    tokens = min(SENDER_BUCKET_CAPACITY, tokens + (now - last).total_seconds() * rate)
+    if tokens >= 1:
+        return None
+
+    return (1 - tokens) / rate
+
+
+async def find_merge_target(db: AsyncSession, email: str, exclude: set) -> Ticket | None:
+    """
+    The sender's newest ticket that is still waiting for triage inside
+    SENDER_MERGE_WINDOW, skipping ids in `exclude` (already being triaged).
+    """
+    if SENDER_MERGE_WINDOW <= 0:
+        return None
+
+    since = datetime.utcnow() - timedelta(seconds=SENDER_MERGE_WINDOW)
+
+    result = await db.execute(
+        select(Ticket)
+        .where(
+            Ticket.email == email,
+            Ticket.status == TicketStatus.pending,
+            Ticket.created_at >= since,
+        )
+        .order_by(Ticket.created_at.desc())
+        .limit(1)
+        .with_for_update()
+    )
+    ticket = result.scalars().first()
+
+    if not ticket or ticket.id in exclude:
+        return None
+
+    return ticket
+
+
+def merge_message(ticket: Ticket, message: str) -> bool:
+    """
+    Append `message` to the ticket. Returns False if it can't be merged.
+    """
+    if message in ticket.message.split(MERGE_SEPARATOR):
+        # Retry of something already merged
+        return True
+
+    merged = f"{ticket.message}{MERGE_SEPARATOR}{message}"
+    if len(merged) > MAX_MERGED_LENGTH:
+        return False
+
+    ticket.message = merged
+    ticket.updated_at = datetime.utcnow()
+    return True
@@ -0,0 +1,67 @@
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from sqlalchemy import text
+from core.database import engine
+
+COLUMNS = (
+    "id, email, message, category, sentiment_score, urgency, ai_draft, "
+    "status, created_at, updated_at, resolved_at"
+)
+
+# Move + insert in one statement so a batch is never half-archived
+ARCHIVE_BATCH = text(f"""
+    WITH moved AS (
+        DELETE FROM tickets
+        WHERE id IN (
+            SELECT id FROM tickets
+            WHERE status = 'resolved' AND resolved_at < :cutoff
+            ORDER BY resolved_at
+            LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING {COLUMNS}
+    )
+    INSERT INTO tickets_archive ({COLUMNS}, archived_at)
+    SELECT {COLUMNS}, :archived_at FROM moved
+""")
+
+
+async def archive_resolved(days: int, batch_size: int):
+    """Move resolved tickets older than `days` into tickets_archive"""
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    total = 0
+
+    print(f"🗄️  Archiving tickets resolved before {cutoff:%Y-%m-%d %H:%M}...\n")
+
+    # One short transaction per batch to keep locks and WAL bursts small
+    while True:
+        async with engine.begin() as conn:
+            result = await conn.execute(ARCHIVE_BATCH, {
+                "cutoff": cutoff,
+                "batch_size": batch_size,
+                "archived_at": datetime.utcnow(),
+            })
+
+        if result.rowcount <= 0:
+            break
+
+        total += result.rowcount
+        print(f"   moved {result.rowcount} (total {total})")
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE tickets"))
+
+    await engine.dispose()
+
+    print(f"\n✅ Archived {total} tickets")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=archive_resolved.__doc__)
+    parser.add_argument("--days", type=int, default=30, help="Archive tickets resolved more than N days ago")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    asyncio.run(archive_resolved(args.days, args.batch_size))
@@ -2,6 +2,8 @@ import asyncio
 from sqlalchemy import text
 from core.database import engine, Base
 from models.ticket import Ticket
+from models.shadow_result import ShadowResult
+from models.zstd_dictionary import ZstdDictionary
 
 
 async def full_reset():
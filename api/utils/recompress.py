@@ -0,0 +1,67 @@
+import argparse
+import asyncio
+from sqlalchemy import bindparam, select, update
+from core.compression import TEXT_COMPRESSION, load_dictionaries
+from core.database import engine, AsyncSessionLocal
+from models.ticket import Ticket, TicketArchive
+
+
+async def recompress_table(model, batch_size: int) -> int:
+    total = 0
+    last_id = None
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            query = (
+                select(model.id, model.message, model.ai_draft)
+                .order_by(model.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                query = query.where(model.id > last_id)
+
+            rows = (await db.execute(query)).all()
+            if not rows:
+                return total
+
+            # Values were decoded on read; writing them back re-encodes
+            # with the current TEXT_COMPRESSION mode and current dictionary.
+            # Core UPDATE so the storage rewrite doesn't bump ticket versions.
+            table = model.__table__
+            await db.execute(
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values(message=bindparam("b_message"), ai_draft=bindparam("b_ai_draft")),
+                [
+                    {"b_id": row.id, "b_message": row.message, "b_ai_draft": row.ai_draft}
+                    for row in rows
+                ],
+            )
+            await db.commit()
+
+        last_id = rows[-1].id
+        total += len(rows)
+        print(f"   {model.__tablename__}: {total}")
+
+
+async def recompress(batch_size: int):
+    """Rewrite ticket text with the current TEXT_COMPRESSION setting"""
+    print(f"🗜️  Rewriting ticket text (TEXT_COMPRESSION={TEXT_COMPRESSION})...\n")
+
+    # Needed to read rows written with older dictionaries and to pick the current one
+    await load_dictionaries()
+
+    for model in (Ticket, TicketArchive):
+        await recompress_table(model, batch_size)
+
+    await engine.dispose()
+
+    print("\n✅ Done. Run VACUUM FULL (or pg_repack) to return the space to the OS")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=recompress.__doc__)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(recompress(args.batch_size))
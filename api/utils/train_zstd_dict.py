@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+from pathlib import Path
+from sqlalchemy import select, update
+from core.compression import ZSTD_DICT_REFRESH, load_dictionaries
+from core.database import engine, AsyncSessionLocal
+from models.ticket import Ticket
+from models.zstd_dictionary import ZstdDictionary
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+async def store_dict(db, dict_id: int, data: bytes, current: bool):
+    if await db.get(ZstdDictionary, dict_id) is None:
+        db.add(ZstdDictionary(dict_id=dict_id, data=data))
+        await db.flush()
+
+    if current:
+        # Old dictionaries stay for reads; only the current one is used for writes
+        await db.execute(
+            update(ZstdDictionary)
+            .values(is_current=(ZstdDictionary.dict_id == dict_id))
+        )
+
+
+async def train_dict(samples: int, dict_size: int):
+    """Train a shared zstd dictionary on existing AI drafts"""
+    if zstandard is None:
+        raise SystemExit("❌ zstandard is not installed (pip install zstandard)")
+
+    # Existing drafts may already be compressed with an older dictionary
+    await load_dictionaries()
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Ticket.ai_draft)
+            .where(Ticket.ai_draft.is_not(None))
+            .order_by(Ticket.created_at.desc())
+            .limit(samples)
+        )
+        drafts = [draft.encode("utf-8") for draft in result.scalars()]
+
+        print(f"📚 Training on {len(drafts)} drafts...")
+        dict_data = zstandard.train_dictionary(dict_size, drafts)
+
+        await store_dict(db, dict_data.dict_id(), dict_data.as_bytes(), current=True)
+        await db.commit()
+
+    await engine.dispose()
+
+    print(f"✅ Stored dictionary {dict_data.dict_id()} in zstd_dictionaries")
+    print(
+        f"📝 Running API instances pick it up within {ZSTD_DICT_REFRESH}s; "
+        "then run `python -m utils.recompress` to apply it to existing rows"
+    )
+
+
+async def import_dir(path: Path):
+    """Copy dictionaries from an old ZSTD_DICT_DIR into the database"""
+    if zstandard is None:
+        raise SystemExit("❌ zstandard is not installed (pip install zstandard)")
+
+    pointer = path / "current"
+    current_id = int(pointer.read_text().strip()) if pointer.is_file() else None
+
+    async with AsyncSessionLocal() as db:
+        for file in sorted(path.glob("*.zdict")):
+            data = file.read_bytes()
+            dict_id = zstandard.ZstdCompressionDict(data).dict_id()
+            await store_dict(db, dict_id, data, current=(dict_id == current_id))
+            print(f"   imported {dict_id}")
+        await db.commit()
+
+    await engine.dispose()
+
+    print(f"✅ Imported dictionaries from {path} (current: {current_id})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=train_dict.__doc__)
+    parser.add_argument("--samples", type=int, default=5000)
+    parser.add_argument("--dict-size", type=int, default=64 * 1024)
+    parser.add_argument("--import-dir", type=Path, help=import_dir.__doc__)
+    args = parser.parse_args()
+
+    if args.import_dir:
+        asyncio.run(import_dir(args.import_dir))
+    else:
+        asyncio.run(train_dict(args.samples, args.dict_size))
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update, or_
+
+from core.database import AsyncSessionLocal
+from models.ticket import Ticket, TicketStatus
+from workers.ticket_processor import process_ticket, in_flight
+
+logger = logging.getLogger(__name__)
+
+# A pending ticket untouched for this long is assumed orphaned
+# (its BackgroundTask died with the process, or it was reopened).
+RECOVERY_STALE_AFTER = int(os.getenv("RECOVERY_STALE_AFTER", "300"))
+RECOVERY_INTERVAL = int(os.getenv("RECOVERY_INTERVAL", "60"))
+RECOVERY_BATCH_SIZE = int(os.getenv("RECOVERY_BATCH_SIZE", "50"))
+RECOVERY_CONCURRENCY = int(os.getenv("RECOVERY_CONCURRENCY", "2"))
+# Max tickets per second handed to the model during replay.
+RECOVERY_RATE = float(os.getenv("RECOVERY_RATE", "1"))
+
+
+async def claim_stale_tickets(limit: int = RECOVERY_BATCH_SIZE) -> list:
+    """
+    Lease a batch of orphaned pending tickets.
+
+    Bumping updated_at acts as the lease, so other replicas (and the next
+    sweep) skip these rows until RECOVERY_STALE_AFTER passes again.
+    process_ticket takes the same lease when it starts and renews it
+    between attempts, so tickets in flight on any replica are skipped too.
+    The status/created_at filter is served by idx_status_created.
+    """
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=RECOVERY_STALE_AFTER)
+
+    candidates = (
+        select(Ticket.id)
+        .where(
+            Ticket.status == TicketStatus.pending,
+            Ticket.created_at < cutoff,
+            or_(Ticket.updated_at.is_(None), Ticket.updated_at < cutoff),
+        )
+        .order_by(Ticket.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(Ticket)
+            .where(Ticket.id.in_(candidates.scalar_subquery()))
+            .values(updated_at=now)
+            .returning(Ticket.id)
+        )
+        ticket_ids = [row[0] for row in result]
+        await db.commit()
+
+    return [ticket_id for ticket_id in ticket_ids if ticket_id not in in_flight]
+
+
+async def replay(ticket_ids: list) -> None:
+    """
+    Re-run triage for a batch, bounded by RECOVERY_CONCURRENCY and RECOVERY_RATE.
+    """
+    semaphore = asyncio.Semaphore(RECOVERY_CONCURRENCY)
+    spacing = 1 / RECOVERY_RATE if RECOVERY_RATE > 0 else 0
+
+    async def run(ticket_id):
+        async with semaphore:
+            await process_ticket(ticket_id)
+
+    tasks = []
+    for ticket_id in ticket_ids:
+        tasks.append(asyncio.create_task(run(ticket_id)))
+        if spacing:
+            await asyncio.sleep(spacing)
+
+    await asyncio.gather(*tasks)
+
+
+async def recover_once() -> int:
+    """
+    Drain all currently stale tickets batch by batch. Returns how many were replayed.
+    """
+    total = 0
+
+    while True:
+        ticket_ids = await claim_stale_tickets()
+        if not ticket_ids:
+            break
+
+        logger.info("Recovering %d stale pending tickets", len(ticket_ids))
+        await replay(ticket_ids)
+        total += len(ticket_ids)
+
+    return total
+
+
+async def run_recovery_loop() -> None:
+    """
+    Sweep on startup, then every RECOVERY_INTERVAL seconds.
+    """
+    while True:
+        try:
+            await recover_once()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Stale ticket recovery sweep failed")
+
+        await asyncio.sleep(RECOVERY_INTERVAL)
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import os
+import random
+import time
+from pathlib import Path
+
+from core.database import AsyncSessionLocal
+from models.shadow_result import ShadowResult
+from workers.ticket_processor import in_flight
+
+logger = logging.getLogger(__name__)
+
+# Candidate to evaluate; shadow mode is off while SHADOW_MODEL is empty.
+SHADOW_MODEL = os.getenv("SHADOW_MODEL", "")
+# Point at a separate Ollama to keep the candidate from evicting the
+# production model; defaults to the production endpoint.
+SHADOW_URL = os.getenv("SHADOW_URL", "")
+# How long Ollama keeps the candidate loaded. Defaults to 0 (unload right
+# away) when sharing the production endpoint, so the candidate doesn't hold
+# memory or evict the production model; otherwise OLLAMA_KEEP_ALIVE.
+SHADOW_KEEP_ALIVE = os.getenv("SHADOW_KEEP_ALIVE", "")
+# Optional file with a candidate SYSTEM_PROMPT
+SHADOW_SYSTEM_PROMPT_FILE = os.getenv("SHADOW_SYSTEM_PROMPT_FILE", "")
+SHADOW_SAMPLE_RATE = float(os.getenv("SHADOW_SAMPLE_RATE", "0.1"))
+# Jobs beyond this are dropped rather than delaying anything
+SHADOW_QUEUE_SIZE = int(os.getenv("SHADOW_QUEUE_SIZE", "100"))
+# How long a shadow job waits for production triage to go idle before
+# running anyway, so sustained load doesn't starve evaluation entirely.
+SHADOW_MAX_WAIT = float(os.getenv("SHADOW_MAX_WAIT", "30"))
+
+_queue: asyncio.Queue | None = None
+
+
+def shadow_enabled() -> bool:
+    return bool(SHADOW_MODEL) and SHADOW_SAMPLE_RATE > 0
+
+
+def shadow_keep_alive(default: str) -> str | int:
+    value = SHADOW_KEEP_ALIVE or ("0" if not SHADOW_URL else default)
+    # Ollama takes seconds as a number, or a duration string like "5m"
+    return int(value) if value.isdigit() else value
+
+
+def candidate_label() -> str:
+    if SHADOW_SYSTEM_PROMPT_FILE:
+        return f"{SHADOW_MODEL}+{Path(SHADOW_SYSTEM_PROMPT_FILE).stem}"
+    return SHADOW_MODEL
+
+
+def maybe_enqueue(ticket_id, message: str, production, production_latency_ms: float) -> None:
+    """
+    Sample a production triage for shadow evaluation. Never blocks: if the
+    shadow worker is behind, the sample is dropped.
+    """
+    if _queue is None or random.random() >= SHADOW_SAMPLE_RATE:
+        return
+
+    try:
+        _queue.put_nowait((ticket_id, message, production, production_latency_ms))
+    except asyncio.QueueFull:
+        logger.debug("Shadow queue full, skipping ticket %s", ticket_id)
+
+
+async def _evaluate(ticket_id, message: str, production, production_latency_ms: float) -> None:
+    from services.ai_triage import OLLAMA_KEEP_ALIVE, OLLAMA_URL, SYSTEM_PROMPT, run_ai_triage
+
+    system_prompt = SYSTEM_PROMPT
+    if SHADOW_SYSTEM_PROMPT_FILE:
+        system_prompt = Path(SHADOW_SYSTEM_PROMPT_FILE).read_text()
+
+    shadow = ShadowResult(
+        ticket_id=ticket_id,
+        candidate=candidate_label(),
+        production_category=production.category.value,
+        production_urgency=production.urgency.value,
+        production_sentiment_score=production.sentiment_score,
+        production_latency_ms=production_latency_ms,
+    )
+
+    started = time.perf_counter()
+    try:
+        candidate = await run_ai_triage(
+            message,
+            model=SHADOW_MODEL,
+            system_prompt=system_prompt,
+            url=SHADOW_URL or OLLAMA_URL,
+            keep_alive=shadow_keep_alive(OLLAMA_KEEP_ALIVE),
+        )
+        shadow.latency_ms = (time.perf_counter() - started) * 1000
+        shadow.category = candidate.category.value
+        shadow.urgency = candidate.urgency.value
+        shadow.sentiment_score = candidate.sentiment_score
+        shadow.draft_reply = candidate.draft_reply
+
+    except Exception as e:
+        shadow.error = f"{type(e).__name__}: {e}"
+
+    async with AsyncSessionLocal() as db:
+        db.add(shadow)
+        await db.commit()
+
+
+async def run_shadow_worker() -> None:
+    """
+    Single consumer that yields to production triage: a job waits (up to
+    SHADOW_MAX_WAIT) until no production ticket is in flight.
+    """
+    global _queue
+
+    if not shadow_enabled():
+        return
+
+    _queue = asyncio.Queue(maxsize=SHADOW_QUEUE_SIZE)
+    logger.info("Shadow evaluation of %s on %.0f%% of tickets", candidate_label(), SHADOW_SAMPLE_RATE * 100)
+
+    try:
+        while True:
+            job = await _queue.get()
+
+            waited = 0.0
+            while in_flight and waited < SHADOW_MAX_WAIT:
+                await asyncio.sleep(0.5)
+                waited += 0.5
+
+            try:
+                await _evaluate(*job)
+            except Exception:
+                logger.exception("Shadow evaluation failed for ticket %s", job[0])
+    finally:
+        _queue = None
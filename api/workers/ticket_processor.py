@@ -1,15 +1,26 @@
+import asyncio
+import time
+from datetime import datetime
+import os
+from sqlalchemy import case, literal, update
 from core.database import AsyncSessionLocal
 from models.ticket import Ticket, TicketStatus, Category, Urgency
-from services.ai_triage import run_ai_triage
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Ticket ids being triaged by this process; the recovery sweep skips them.
+in_flight: set = set()
+
+# Triage re-runs allowed when the message changes underneath it (merges)
+TRIAGE_MAX_ATTEMPTS = int(os.getenv("TRIAGE_MAX_ATTEMPTS", "3"))
+
 def map_category(value: str) -> Category:
     mapping = {
         "billing": Category.billing,
         "technical": Category.technical,
-        "feature request": Category.feature,
+        "feature": Category.feature,
+        "general": Category.general,
     }
     return mapping[value.lower()]
 
@@ -23,27 +34,124 @@ def map_urgency(value: str) -> Urgency:
     return mapping[value.lower()]
 
 
-async def process_ticket(ticket_id):
+async def process_ticket(ticket_id, delay: float = 0):
+    if delay:
+        # Lets follow-up messages from the same sender be merged first
+        await asyncio.sleep(delay)
+
+    if ticket_id in in_flight:
+        return
+
+    in_flight.add(ticket_id)
+    try:
+        await _process_ticket(ticket_id)
+    finally:
+        in_flight.discard(ticket_id)
+
+
+async def _lease_pending(ticket_id):
+    """
+    Read a pending ticket and bump its updated_at, the lease the recovery
+    sweep checks, so other replicas don't replay it while it's being
+    triaged here. Doesn't touch version, so it never conflicts with writers.
+    """
     async with AsyncSessionLocal() as db:
-        ticket = await db.get(Ticket, ticket_id)
+        result = await db.execute(
+            update(Ticket)
+            .where(Ticket.id == ticket_id, Ticket.status == TicketStatus.pending)
+            .values(updated_at=datetime.utcnow())
+            .returning(Ticket.message, Ticket.version)
+        )
+        row = result.first()
+        await db.commit()
 
-        if not ticket:
-            return
+    return row
+
+
+async def _apply_result(ticket_id, version: int, values: dict) -> bool:
+    """
+    Write the triage result if the ticket is still pending at `version`.
+    A draft an agent already edited is kept.
+    """
+    values = dict(values)
+    if "ai_draft" in values:
+        values["ai_draft"] = case(
+            # literal() keeps the CompressedText encoding for the new value
+            (Ticket.draft_edited_at.is_(None), literal(values["ai_draft"], Ticket.ai_draft.type)),
+            else_=Ticket.ai_draft,
+        )
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(Ticket)
+            .where(
+                Ticket.id == ticket_id,
+                Ticket.version == version,
+                Ticket.status == TicketStatus.pending,
+            )
+            .values(**values, updated_at=datetime.utcnow(), version=Ticket.version + 1)
+        )
+        await db.commit()
+
+    return result.rowcount > 0
+
+
+async def _process_ticket(ticket_id):
+    row = await _lease_pending(ticket_id)
+
+    # Missing, already triaged, or resolved while it sat in the recovery backlog
+    if not row:
+        return
+
+    # Imported here so the LLM client stack loads off the API startup path
+    from services.ai_triage import run_ai_triage
+    from workers.shadow import maybe_enqueue
+
+    for attempt in range(TRIAGE_MAX_ATTEMPTS):
+        started = time.perf_counter()
 
         try:
-            ai_result = await run_ai_triage(ticket.message)
+            ai_result = await run_ai_triage(row.message)
+            latency_ms = (time.perf_counter() - started) * 1000
 
-            ticket.category = map_category(ai_result.category)
-            ticket.sentiment_score = ai_result.sentiment_score
-            ticket.urgency = map_urgency(ai_result.urgency)
-            ticket.ai_draft = ai_result.draft_reply
-            ticket.status = TicketStatus.processed
+            values = {
+                "category": map_category(ai_result.category),
+                "sentiment_score": ai_result.sentiment_score,
+                "urgency": map_urgency(ai_result.urgency),
+                "ai_draft": ai_result.draft_reply,
+                "status": TicketStatus.processed,
+            }
 
         except Exception as e:
             logger.exception("AI processing failed for ticket %s", ticket_id)
-            ticket.status = TicketStatus.error
-            ticket.ai_draft = (
-                "We are reviewing your request and will get back to you shortly."
-            )
+            values = {
+                "status": TicketStatus.error,
+                "ai_draft": (
+                    "We are reviewing your request and will get back to you shortly."
+                ),
+            }
 
-        await db.commit()
+        # Only apply the result if nobody touched the ticket during triage.
+        # If it changed but is still pending (agent draft edit, merged
+        # follow-up message), re-read it: the same result is re-applied
+        # when the message is unchanged, otherwise triage runs again.
+        # The re-read also renews the lease for the next attempt.
+        while not await _apply_result(ticket_id, row.version, values):
+            fresh = await _lease_pending(ticket_id)
+            if not fresh:
+                logger.info("Discarding triage result for ticket %s: no longer pending", ticket_id)
+                return
+
+            message_changed = fresh.message != row.message
+            row = fresh
+            if message_changed:
+                break
+        else:
+            # Only compare against results production actually accepted
+            if values["status"] == TicketStatus.processed:
+                maybe_enqueue(ticket_id, row.message, ai_result, latency_ms)
+            return
+
+        logger.info("Ticket %s message changed during triage, re-running", ticket_id)
+
+    logger.warning("Giving up on ticket %s after %d triage attempts", ticket_id, TRIAGE_MAX_ATTEMPTS)